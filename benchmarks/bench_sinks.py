@@ -0,0 +1,63 @@
+"""
+Benchmark README output sinks.
+
+Renders a sample profile once and writes it N times through every sink,
+reporting files-per-second including the final durable commit.
+
+Usage:
+    python benchmarks/bench_sinks.py [--count 10000] [--template minimal]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from gitprofilebuilder.sinks import SINKS, open_sink
+from gitprofilebuilder.templates import template_manager
+
+SAMPLE_PROFILE = {
+    "personal_info": {"name": "Jane Doe", "email": "jane@example.com", "location": "Remote"},
+    "summary": "Backend engineer focused on distributed systems and developer tooling.",
+    "work_experience": [
+        {
+            "company": "Example Corp",
+            "title": "Senior Engineer",
+            "duration": "2020 - Present",
+            "responsibilities": ["Built the ingestion pipeline", "Cut p99 latency by 40%"],
+        }
+    ],
+    "education": [{"degree": "B.Sc. Computer Science", "institution": "State University", "graduation_year": "2016"}],
+    "skills": {"technical_skills": ["Python", "Go", "PostgreSQL"], "soft_skills": ["Mentoring"]},
+    "certifications": [],
+    "enhanced": {},
+}
+
+
+def run(kind: str, root: Path, count: int, content: str) -> float:
+    """Write ``count`` READMEs through one sink and return files per second."""
+    path = root / ("files" if kind == "file" else f"profiles.{kind}")
+    
+    start = time.perf_counter()
+    with open_sink(kind, path) as sink:
+        for i in range(count):
+            sink.write(f"resume-{i:06d}", content)
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--template", default="minimal")
+    args = parser.parse_args()
+    
+    content = template_manager.render_template(args.template, SAMPLE_PROFILE)
+    print(f"{args.count} renders, {len(content.encode('utf-8'))} bytes each")
+    for kind in SINKS:
+        with tempfile.TemporaryDirectory() as tmp:
+            rate = run(kind, Path(tmp), args.count, content)
+        print(f"{kind:>8}: {rate:10.0f} files/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,22 +5,82 @@ Uses Click to provide a rich CLI experience for generating GitHub profile README
 
 import click
 import json
+import os
 import time
+from contextlib import nullcontext
 from typing import Optional
 from pathlib import Path
 from tqdm import tqdm
 from rich.console import Console
 from rich.panel import Panel
 from rich.tree import Tree
+from rich.table import Table
 from rich import print as rprint
 from rich.pretty import pprint
 from rich.syntax import Syntax
 from gitprofilebuilder import gitprofilebuilder
 from gitprofilebuilder.templates import TEMPLATES
+from gitprofilebuilder.sinks import SINKS, SinkError, open_sink, resume_keys
+from gitprofilebuilder.profile_generator import ProfileGenerator
+from gitprofilebuilder.profiling import MemoryProfiler, format_bytes, profile_stage
 
 # Initialize rich console
 console = Console()
 
+def print_memory_report(profiler: MemoryProfiler) -> None:
+    """Print the stage, per-resume and top allocator tables of a memory profile."""
+    stages = Table(title="🧠 Memory by Stage")
+    stages.add_column("Stage", style="bright_blue")
+    stages.add_column("Calls", justify="right")
+    stages.add_column("Net", justify="right")
+    stages.add_column("Peak", justify="right")
+    for name, stats in profiler.stages.items():
+        stages.add_row(
+            name,
+            str(stats['calls']),
+            format_bytes(stats['net_bytes']),
+            format_bytes(stats['peak_bytes'])
+        )
+    console.print(stages)
+    
+    items = Table(title="📄 Retained Memory per Resume")
+    items.add_column("Resume", style="bright_blue")
+    items.add_column("Retained", justify="right")
+    items.add_column("Traced Total", justify="right")
+    for item in profiler.items:
+        style = "bold bright_red" if item['flagged'] else None
+        items.add_row(
+            item['resume_id'],
+            format_bytes(item['retained_bytes']),
+            format_bytes(item['total_bytes']),
+            style=style
+        )
+    console.print(items)
+    
+    allocators = Table(title="🔝 Top Allocators")
+    allocators.add_column("Location", style="bright_blue", overflow="fold")
+    allocators.add_column("Size", justify="right")
+    allocators.add_column("Change", justify="right")
+    allocators.add_column("Blocks", justify="right")
+    for stat in profiler.top_allocators():
+        frame = stat.traceback[0]
+        allocators.add_row(
+            f"{frame.filename}:{frame.lineno}",
+            format_bytes(stat.size),
+            format_bytes(stat.size_diff),
+            str(stat.count)
+        )
+    console.print(allocators)
+    
+    flagged = [item['resume_id'] for item in profiler.items if item['flagged']]
+    if flagged:
+        console.print(
+            f"[bold bright_red]⚠️  {len(flagged)} resume(s) retained more than "
+            f"{format_bytes(profiler.growth_threshold)}: {', '.join(flagged)}[/]"
+        )
+    if len(profiler.items) > 1:
+        console.print(f"📈 Growth across resumes: [bright_blue]{format_bytes(profiler.growth())}[/]")
+
 @click.group()
 def cli():
     """GitProfile Builder - Create awesome GitHub profile READMEs from your resume."""
@@ -50,12 +110,18 @@ def cli():
     is_flag=True,
     help='Show detailed processing information.'
 )
+@click.option(
+    '--profile-memory',
+    is_flag=True,
+    help='Trace memory allocations per stage and resume and print a report.'
+)
 def generate(
     resume_path: Path,
     output: Path,
     template: str,
     force: bool,
     verbose: bool,
+    profile_memory: bool,
 ) -> None:
     """
     Generate a GitHub profile README from a resume PDF.
@@ -69,9 +135,11 @@ def generate(
                 click.echo('Operation cancelled.')
                 return
         
+        profiler = MemoryProfiler() if profile_memory else None
+        
         # Initialize progress bar
         steps = ['Loading resume', 'Extracting information', 'Generating profile', 'Saving']
-        with tqdm(total=len(steps), desc='Generating GitHub profile', 
+        with profiler or nullcontext(), tqdm(total=len(steps), desc='Generating GitHub profile', 
                  bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt}',
                  disable=verbose) as pbar:
             
@@ -84,52 +152,54 @@ def generate(
                         str(resume_path),
                         str(output),
                         template,
-                        verbose=True  # Always get data when verbose
+                        verbose=True,  # Always get data when verbose
+                        profiler=profiler
                     )
                     
                     # Show intermediate data if verbose
                     if verbose and data:
-                        # Show resume text
-                        if 'resume_text' in data:
-                            console.print("\n[bold bright_green]📄 Resume Text:[/]")
-                            syntax = Syntax(
-                                data['resume_text'],
-                                "text",
-                                theme="monokai",
-                                line_numbers=True,
-                                word_wrap=True
-                            )
-                            console.print(Panel(syntax))
+                        with profile_stage(profiler, 'verbose_output'):
+                            # Show resume text
+                            if 'resume_text' in data:
+                                console.print("\n[bold bright_green]📄 Resume Text:[/]")
+                                syntax = Syntax(
+                                    data['resume_text'],
+                                    "text",
+                                    theme="monokai",
+                                    line_numbers=True,
+                                    word_wrap=True
+                                )
+                                console.print(Panel(syntax))
                         
-                        # Show structured data
-                        if 'structured_data' in data:
-                            console.print("\n[bold bright_green]🔍 Structured Data:[/]")
+                            # Show structured data
+                            if 'structured_data' in data:
+                                console.print("\n[bold bright_green]🔍 Structured Data:[/]")
                             
-                            # Create tree structure for nested data
-                            root = Tree("📋 Resume Structure")
+                                # Create tree structure for nested data
+                                root = Tree("📋 Resume Structure")
                             
-                            def add_to_tree(data: dict, tree: Tree):
-                                for key, value in data.items():
-                                    if isinstance(value, dict):
-                                        branch = tree.add(f"[bold bright_blue]{key}")
-                                        add_to_tree(value, branch)
-                                    elif isinstance(value, list):
-                                        branch = tree.add(f"[bold bright_blue]{key}")
-                                        for item in value:
-                                            if isinstance(item, dict):
-                                                sub_branch = branch.add("•")
-                                                add_to_tree(item, sub_branch)
-                                            else:
-                                                branch.add(f"[light_green]• {item}")
-                                    else:
-                                        tree.add(f"[bright_blue]{key}:[/] [light_green]{value}")
+                                def add_to_tree(data: dict, tree: Tree):
+                                    for key, value in data.items():
+                                        if isinstance(value, dict):
+                                            branch = tree.add(f"[bold bright_blue]{key}")
+                                            add_to_tree(value, branch)
+                                        elif isinstance(value, list):
+                                            branch = tree.add(f"[bold bright_blue]{key}")
+                                            for item in value:
+                                                if isinstance(item, dict):
+                                                    sub_branch = branch.add("•")
+                                                    add_to_tree(item, sub_branch)
+                                                else:
+                                                    branch.add(f"[light_green]• {item}")
+                                        else:
+                                            tree.add(f"[bright_blue]{key}:[/] [light_green]{value}")
                             
-                            add_to_tree(data['structured_data'], root)
-                            console.print(root)
+                                add_to_tree(data['structured_data'], root)
+                                console.print(root)
                             
-                            # Also show raw data for inspection
-                            console.print("\n[bold bright_green]🔍 Raw Data (for inspection):[/]")
-                            pprint(data['structured_data'])
+                                # Also show raw data for inspection
+                                console.print("\n[bold bright_green]🔍 Raw Data (for inspection):[/]")
+                                pprint(data['structured_data'])
                 
                 # Simulate progress for other steps
                 else:
@@ -146,6 +216,136 @@ def generate(
             border_style="bright_green"
         ))
         
+        if profiler is not None:
+            print_memory_report(profiler)
+        
+    except Exception as e:
+        console.print(Panel(
+            f"[bold bright_red]Error: {str(e)}[/]",
+            title="Error",
+            border_style="bright_red"
+        ))
+        raise click.Abort()
+
+@cli.command()
+@click.argument(
+    'resume_paths',
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    '--output', '-o',
+    type=click.Path(path_type=Path),
+    default=Path('profiles'),
+    help='Output directory (file sink) or archive/store path (other sinks).'
+)
+@click.option(
+    '--sink', '-s',
+    type=click.Choice(list(SINKS.keys()), case_sensitive=False),
+    default='file',
+    help='Where to store the generated READMEs.'
+)
+@click.option(
+    '--template', '-t',
+    type=click.Choice(list(TEMPLATES.keys()), case_sensitive=False),
+    default='minimal',
+    help='Template style to use for the profiles.'
+)
+@click.option(
+    '--force', '-f',
+    is_flag=True,
+    help='Overwrite existing output without asking.'
+)
+@click.option(
+    '--profile-memory',
+    is_flag=True,
+    help='Trace memory allocations per stage and resume and print a report.'
+)
+def batch(
+    resume_paths: tuple,
+    output: Path,
+    sink: str,
+    template: str,
+    force: bool,
+    profile_memory: bool,
+) -> None:
+    """
+    Generate GitHub profile READMEs for many resume PDFs.
+    
+    Each README is stored under the resume path relative to the common
+    directory of all resumes (without suffix). Resumes that fail are skipped
+    and reported; the rest of the batch is committed to the sink once at the end.
+    
+    RESUME_PATHS: Paths to resume PDF files
+    """
+    failed = {}
+    try:
+        keys = resume_keys(resume_paths)
+        profiler = MemoryProfiler() if profile_memory else None
+        
+        # One generator is reused for the whole batch and reset after each resume.
+        # It is built first so configuration errors leave existing output untouched.
+        generator = ProfileGenerator(profiler=profiler)
+        
+        # Check for existing output
+        if sink == 'file':
+            existing = [str(output / f"{key}.md") for key in keys if (output / f"{key}.md").exists()]
+        else:
+            existing = [str(output)] if output.exists() else []
+        if existing and not force:
+            if not click.confirm(f'{", ".join(existing)} already exist(s). Do you want to overwrite?'):
+                click.echo('Operation cancelled.')
+                return
+        
+        # Existing stores are only replaced once at least one README was committed
+        target = output
+        if sink != 'file' and existing:
+            target = output.with_name(f"{output.name}.tmp")
+            target.unlink(missing_ok=True)
+        
+        try:
+            with profiler or nullcontext(), open_sink(sink, target) as out:
+                for resume_path, key in tqdm(list(zip(resume_paths, keys)), desc='Generating GitHub profiles'):
+                    try:
+                        gitprofilebuilder(
+                            str(resume_path),
+                            template_name=template,
+                            sink=out,
+                            resume_id=key,
+                            generator=generator,
+                            profiler=profiler
+                        )
+                    except SinkError:
+                        # The sink may have lost or half-written records; abort the whole batch
+                        raise
+                    except Exception as e:
+                        failed[str(resume_path)] = str(e)
+            
+            if target != output and len(failed) < len(keys):
+                os.replace(target, output)
+        finally:
+            if target != output:
+                target.unlink(missing_ok=True)
+        
+        console.print(Panel(
+            f"[bold bright_green]✨ Successfully generated {len(keys) - len(failed)} GitHub profiles![/]\n\n"
+            f"📝 Output: [bright_blue]{output}[/] ({sink})\n"
+            f"🎨 Template: [bright_blue]{template}[/]",
+            title="Success",
+            border_style="bright_green"
+        ))
+        
+        if failed:
+            console.print(Panel(
+                "\n".join(f"[bright_blue]{path}[/]: {error}" for path, error in failed.items()),
+                title=f"Failed ({len(failed)})",
+                border_style="bright_red"
+            ))
+        
+        if profiler is not None:
+            print_memory_report(profiler)
+        
     except Exception as e:
         console.print(Panel(
             f"[bold bright_red]Error: {str(e)}[/]",
@@ -153,6 +353,9 @@ def generate(
             border_style="bright_red"
         ))
         raise click.Abort()
+    
+    if failed:
+        raise SystemExit(1)
 
 @cli.command()
 def templates():
@@ -13,6 +13,7 @@ from langchain.prompts import PromptTemplate
 from langchain_community.document_loaders import PyPDFium2Loader
 
 from .config import Config
+from .profiling import MemoryProfiler, profile_stage
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -98,12 +99,13 @@ Keep all responses concise and in a single line without line breaks.
 class ProfileGenerator:
     """Generates GitHub profile data from resume."""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, profiler: Optional[MemoryProfiler] = None):
         """
         Initialize the profile generator with configuration.
         
         Args:
             verbose (bool): Whether to show detailed logging messages
+            profiler (Optional[MemoryProfiler]): Memory profiler to record pipeline stages with
         """
         self.config = Config()
         self.config.validate_config()
@@ -119,6 +121,7 @@ class ProfileGenerator:
         self.resume_text: Optional[str] = None
         self.structured_data: Optional[Dict] = None
         self.verbose = verbose
+        self.profiler = profiler
         
         # Set logging level based on verbose flag
         logger.setLevel(logging.INFO if verbose else logging.ERROR)
@@ -132,6 +135,11 @@ class ProfileGenerator:
         """Log error message."""
         logger.error(message)
     
+    def reset(self) -> None:
+        """Release intermediate data so the generator can be reused for the next resume."""
+        self.resume_text = None
+        self.structured_data = None
+    
     def extract_resume_text(self, resume_path: str) -> str:
         """
         Extract text from a PDF resume.
@@ -228,13 +236,16 @@ class ProfileGenerator:
         """
         try:
             # Extract text from resume
-            self.extract_resume_text(resume_path)
+            with profile_stage(self.profiler, 'extract_resume_text'):
+                self.extract_resume_text(resume_path)
             
             # Extract structured data
-            self.extract_structured_data()
+            with profile_stage(self.profiler, 'extract_structured_data'):
+                self.extract_structured_data()
             
             # Enhance profile data
-            profile_data = self.enhance_profile_data()
+            with profile_stage(self.profiler, 'enhance_profile_data'):
+                profile_data = self.enhance_profile_data()
             
             self._log_info("Successfully generated complete profile")
             return profile_data
@@ -0,0 +1,176 @@
+"""
+Opt-in memory profiling for README generation.
+
+Wraps pipeline stages and per-resume work in tracemalloc measurements so long
+batch runs can report where memory is allocated, how much each resume leaves
+behind, and which resumes grew the process noticeably.
+"""
+
+import logging
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import ContextManager, Dict, Iterator, List, Optional
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_N = 10
+DEFAULT_GROWTH_THRESHOLD = 256 * 1024  # bytes retained per resume before it is flagged
+
+_IGNORED_TRACES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def format_bytes(size: float) -> str:
+    """Format a byte count as a short human readable string."""
+    sign = "-" if size < 0 else ""
+    size = abs(size)
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+    return f"{sign}{size:.1f} GiB"
+
+
+class MemoryProfiler:
+    """Collects tracemalloc statistics around pipeline stages and resumes."""
+
+    def __init__(
+        self,
+        top_n: int = DEFAULT_TOP_N,
+        growth_threshold: int = DEFAULT_GROWTH_THRESHOLD,
+        frames: int = 1,
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            top_n (int, optional): Number of top allocators to report. Defaults to 10.
+            growth_threshold (int, optional): Bytes a resume may retain before it is
+                                              flagged. Defaults to 256 KiB.
+            frames (int, optional): Traceback depth recorded per allocation. Defaults to 1.
+        """
+        self.top_n = top_n
+        self.growth_threshold = growth_threshold
+        self.frames = frames
+
+        self.stages: Dict[str, Dict] = {}
+        self.items: List[Dict] = []
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+        self._final: Optional[tracemalloc.Snapshot] = None
+        self._started_tracing = False
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+
+    def start(self) -> None:
+        """Start tracing and take the baseline snapshot."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._baseline = self._snapshot()
+        self._final = None
+
+    def stop(self) -> None:
+        """Take the final snapshot and stop tracing if this profiler started it."""
+        if self._baseline is None:
+            return
+        self._final = self._snapshot()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Measure net and peak traced memory for one pipeline stage.
+
+        Args:
+            name (str): Stage name; repeated stages are aggregated
+        """
+        if not tracemalloc.is_tracing():
+            yield
+            return
+
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            after, peak = tracemalloc.get_traced_memory()
+            stats = self.stages.setdefault(name, {'calls': 0, 'net_bytes': 0, 'peak_bytes': 0})
+            stats['calls'] += 1
+            stats['net_bytes'] += after - before
+            stats['peak_bytes'] = max(stats['peak_bytes'], peak - before)
+
+    @contextmanager
+    def item(self, resume_id: str) -> Iterator[None]:
+        """
+        Measure the bytes still allocated after processing one resume.
+
+        Args:
+            resume_id (str): Identifier of the resume being processed
+        """
+        if not tracemalloc.is_tracing():
+            yield
+            return
+
+        before, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            after, _ = tracemalloc.get_traced_memory()
+            retained = after - before
+            flagged = retained > self.growth_threshold
+            self.items.append({
+                'resume_id': resume_id,
+                'retained_bytes': retained,
+                'total_bytes': after,
+                'flagged': flagged,
+            })
+            if flagged:
+                logger.warning(
+                    f"Resume '{resume_id}' retained {format_bytes(retained)} "
+                    f"(threshold {format_bytes(self.growth_threshold)})"
+                )
+
+    def top_allocators(self) -> List[tracemalloc.StatisticDiff]:
+        """
+        Get the source lines that allocated the most memory since ``start``.
+
+        Returns:
+            List[tracemalloc.StatisticDiff]: Up to ``top_n`` allocation sites
+        """
+        if self._baseline is None:
+            return []
+        final = self._final or self._snapshot()
+        return final.compare_to(self._baseline, 'lineno')[:self.top_n]
+
+    def growth(self) -> int:
+        """Get traced memory growth from the first to the last profiled resume."""
+        if not self.items:
+            return 0
+        first = self.items[0]
+        return self.items[-1]['total_bytes'] - (first['total_bytes'] - first['retained_bytes'])
+
+    def __enter__(self) -> "MemoryProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+
+def profile_stage(profiler: Optional[MemoryProfiler], name: str) -> ContextManager:
+    """Return ``profiler.stage(name)``, or a no-op context if profiling is disabled."""
+    return profiler.stage(name) if profiler is not None else nullcontext()
+
+
+def profile_item(profiler: Optional[MemoryProfiler], resume_id: str) -> ContextManager:
+    """Return ``profiler.item(resume_id)``, or a no-op context if profiling is disabled."""
+    return profiler.item(resume_id) if profiler is not None else nullcontext()
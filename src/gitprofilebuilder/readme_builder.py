@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Dict, Optional, Union
 
 from .profile_generator import ProfileGenerator
+from .profiling import MemoryProfiler, profile_item, profile_stage
+from .sinks import OutputSink
 from .templates import get_template, template_manager
 
 # Set up logging
@@ -17,6 +19,10 @@ def generate_and_save_readme(
     output_path: Union[str, Path] = "profile_readme.md",
     template_name: str = "minimal",
     verbose: bool = False,
+    sink: Optional[OutputSink] = None,
+    resume_id: Optional[str] = None,
+    generator: Optional[ProfileGenerator] = None,
+    profiler: Optional[MemoryProfiler] = None,
 ) -> Optional[Dict]:
     """
     Generate a GitHub profile README from a resume and save it.
@@ -27,6 +33,18 @@ def generate_and_save_readme(
                                                 Defaults to "profile_readme.md".
         template_name (str, optional): Template to use. Defaults to "minimal".
         verbose (bool, optional): Whether to show detailed logging messages. Defaults to False.
+        sink (Optional[OutputSink], optional): Sink to buffer the README into instead of
+                                               writing output_path. The caller is
+                                               responsible for committing it. Defaults to None.
+        resume_id (Optional[str], optional): Key the README is stored under in the sink.
+                                             Defaults to the resume file name without suffix.
+        generator (Optional[ProfileGenerator], optional): Generator to reuse across resumes.
+                                                          Its intermediate data is released after
+                                                          this resume, and profiler replaces its
+                                                          own for this call only. Defaults to a
+                                                          new generator.
+        profiler (Optional[MemoryProfiler], optional): Memory profiler to record this resume
+                                                       and its pipeline stages with. Defaults to None.
     
     Returns:
         Optional[Dict]: If verbose is True, returns a dictionary containing:
@@ -38,6 +56,7 @@ def generate_and_save_readme(
     Raises:
         FileNotFoundError: If resume file doesn't exist
         ValueError: If template name is invalid
+        SinkError: If the sink fails to write out buffered READMEs
     """
     try:
         # Set logging level based on verbose flag
@@ -54,27 +73,48 @@ def generate_and_save_readme(
         # Validate template
         template_name = get_template(template_name)
         
-        # Generate profile data
-        generator = ProfileGenerator(verbose=verbose)
-        profile_data = generator.generate_profile(str(resume_path))
+        resume_id = resume_id or resume_path.stem
+        result = None
         
-        # Render template
-        readme_content = template_manager.render_template(template_name, profile_data)
+        with profile_item(profiler, resume_id):
+            # Generate profile data
+            if generator is None:
+                generator = ProfileGenerator(verbose=verbose, profiler=profiler)
+            # Profile this call only; a reused generator keeps its own profiler
+            previous_profiler, generator.profiler = generator.profiler, profiler
+            try:
+                profile_data = generator.generate_profile(str(resume_path))
+                
+                # Render template
+                with profile_stage(profiler, 'render_template'):
+                    readme_content = template_manager.render_template(template_name, profile_data)
+                
+                # Save to sink or file
+                with profile_stage(profiler, 'save'):
+                    if sink is not None:
+                        sink.write(resume_id, readme_content)
+                    else:
+                        output_path.write_text(readme_content, encoding='utf-8')
+                if verbose:
+                    target = f"'{resume_id}' into {sink.path}" if sink is not None else f"at {output_path}"
+                    logger.info(f"Successfully generated GitHub profile {target}")
+                
+                # Return intermediate data if verbose
+                if verbose:
+                    result = {
+                        'resume_text': generator.resume_text,
+                        'structured_data': generator.structured_data,
+                        'enhanced': profile_data.get('enhanced', {})
+                    }
+                
+                # Drop local references so they are not counted as retained by the profiler
+                del profile_data, readme_content
+            finally:
+                # Release per-resume state so reused generators stay bounded
+                generator.reset()
+                generator.profiler = previous_profiler
         
-        # Save to file
-        output_path.write_text(readme_content, encoding='utf-8')
-        if verbose:
-            logger.info(f"Successfully generated GitHub profile at {output_path}")
-        
-        # Return intermediate data if verbose
-        if verbose:
-            return {
-                'resume_text': generator.resume_text,
-                'structured_data': generator.structured_data,
-                'enhanced': profile_data.get('enhanced', {})
-            }
-        
-        return None
+        return result
         
     except Exception as e:
         logger.error(f"Failed to generate profile: {str(e)}")
@@ -0,0 +1,385 @@
+"""
+Output sinks for generated GitHub profile READMEs.
+
+A sink receives rendered READMEs keyed by resume ID, buffers them in memory
+and persists them in bulk. Each call to ``commit`` performs one durable write
+for everything buffered since the previous commit, so a batch render costs a
+single flush/fsync instead of one per file. ``abort`` discards everything
+written since the last commit instead.
+
+Keys must be unique within a batch. Across batches, the file and SQLite sinks
+replace existing entries, while the tar, zip and JSONL sinks always append,
+so a key written in two batches appears twice in those outputs.
+"""
+
+import io
+import json
+import logging
+import os
+import sqlite3
+import tarfile
+import time
+import zipfile
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_SIZE = 256
+
+
+class SinkError(Exception):
+    """Raised when a sink fails to write out or commit buffered records."""
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file's contents to stable storage."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def resume_keys(resume_paths: Iterable[Union[str, Path]]) -> List[str]:
+    """
+    Build unique sink keys for a batch of resumes.
+
+    Keys are the resume paths relative to their common directory, without the
+    file suffix, so ``a/cv.pdf`` and ``b/cv.pdf`` become ``a/cv`` and ``b/cv``.
+
+    Args:
+        resume_paths (Iterable[Union[str, Path]]): Paths to the resume files
+
+    Returns:
+        List[str]: One key per resume, in input order
+
+    Raises:
+        ValueError: If two resumes map to the same key
+    """
+    resolved = [Path(path).resolve() for path in resume_paths]
+    if not resolved:
+        return []
+    root = Path(os.path.commonpath([path.parent for path in resolved]))
+    keys = [path.relative_to(root).with_suffix('').as_posix() for path in resolved]
+
+    duplicates = sorted(key for key, count in Counter(keys).items() if count > 1)
+    if duplicates:
+        raise ValueError(f"Duplicate resume IDs: {', '.join(duplicates)}")
+    return keys
+
+
+class OutputSink:
+    """
+    Base class for README output sinks.
+
+    Subclasses implement ``_flush`` to persist a list of ``(key, content)``
+    records and may override ``_sync``, ``_rollback`` and ``_release`` to make
+    writes durable, undo an uncommitted batch and release resources.
+    """
+
+    def __init__(self, path: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE):
+        """
+        Initialize the sink.
+
+        Args:
+            path (Union[str, Path]): Destination file or directory
+            buffer_size (int, optional): Number of records buffered before they
+                                         are written out. Defaults to 256.
+        """
+        if buffer_size < 1:
+            raise ValueError("buffer_size must be at least 1")
+        self.path = Path(path)
+        self.buffer_size = buffer_size
+        self._pending: List[Tuple[str, str]] = []
+        self._batch_keys: Set[str] = set()
+        self._closed = False
+
+    def write(self, key: str, content: str) -> None:
+        """
+        Buffer a rendered README.
+
+        Args:
+            key (str): Resume ID the README belongs to
+            content (str): Rendered README content
+
+        Raises:
+            ValueError: If the sink is closed or the key was already written in this batch
+            SinkError: If the buffer was full and could not be written out
+        """
+        if self._closed:
+            raise ValueError(f"Cannot write to closed sink at {self.path}")
+        if key in self._batch_keys:
+            raise ValueError(f"Duplicate key '{key}' in batch for {self.path}")
+        self._batch_keys.add(key)
+        self._pending.append((key, content))
+        if len(self._pending) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write buffered records out without forcing them to disk.
+
+        Raises:
+            SinkError: If the records could not be written; they stay buffered
+        """
+        if self._pending:
+            try:
+                self._flush(self._pending)
+            except Exception as e:
+                raise SinkError(f"Failed to write to {self.path}: {str(e)}") from e
+            self._pending = []
+
+    def commit(self) -> None:
+        """
+        Write buffered records and make everything written so far durable.
+
+        Raises:
+            SinkError: If the records could not be written or committed
+        """
+        self.flush()
+        try:
+            self._sync()
+        except Exception as e:
+            raise SinkError(f"Failed to commit {self.path}: {str(e)}") from e
+        self._batch_keys.clear()
+
+    def abort(self) -> None:
+        """Discard records written since the last commit and release the sink."""
+        if not self._closed:
+            self._pending = []
+            self._batch_keys.clear()
+            self._rollback()
+            self._release()
+            self._closed = True
+
+    def close(self) -> None:
+        """Commit outstanding records and release the sink."""
+        if not self._closed:
+            self.commit()
+            self._release()
+            self._closed = True
+
+    def _flush(self, records: List[Tuple[str, str]]) -> None:
+        raise NotImplementedError
+
+    def _sync(self) -> None:
+        pass
+
+    def _rollback(self) -> None:
+        pass
+
+    def _release(self) -> None:
+        pass
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
+            return
+        try:
+            self.close()
+        except Exception:
+            self.abort()
+            raise
+
+
+class FileSink(OutputSink):
+    """
+    Writes each README to its own file, saved as ``<path>/<key>.md``.
+
+    Like ``generate_and_save_readme``, this sink leaves durability to the
+    filesystem: ``commit`` does not fsync the files, and ``abort`` only drops
+    records that have not been flushed yet.
+    """
+
+    def __init__(self, path: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE):
+        super().__init__(path, buffer_size)
+        if self.path.exists() and not self.path.is_dir():
+            raise ValueError(f"File sink path {self.path} exists and is not a directory")
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _flush(self, records: List[Tuple[str, str]]) -> None:
+        for key, content in records:
+            target = self.path / f"{key}.md"
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(content, encoding='utf-8')
+
+
+class _ArchiveSink(OutputSink):
+    """
+    Base class for sinks that append members to a single archive file.
+
+    The archive is opened lazily in append mode and closed on every commit so
+    that its trailer or central directory is on disk after each batch.
+    """
+
+    def __init__(self, path: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE):
+        super().__init__(path, buffer_size)
+        self._archive = None
+
+    def _open(self):
+        raise NotImplementedError
+
+    def _add(self, name: str, data: bytes) -> None:
+        raise NotImplementedError
+
+    def _flush(self, records: List[Tuple[str, str]]) -> None:
+        if self._archive is None:
+            self._archive = self._open()
+        for key, content in records:
+            self._add(f"{key}.md", content.encode('utf-8'))
+
+    def _sync(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+            _fsync_path(self.path)
+
+
+class TarSink(_ArchiveSink):
+    """Appends READMEs as members of an uncompressed tar archive."""
+
+    def _open(self) -> tarfile.TarFile:
+        archive = tarfile.open(self.path, mode='a')
+        self._start = archive.offset
+        return archive
+
+    def _add(self, name: str, data: bytes) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        self._archive.addfile(info, io.BytesIO(data))
+
+    def _rollback(self) -> None:
+        if self._archive is None:
+            return
+        archive, self._archive = self._archive, None
+        # Rewrite the end-of-archive blocks right after the last committed member
+        archive.fileobj.seek(self._start)
+        archive.offset = self._start
+        archive.close()
+        end = self._start + 2 * tarfile.BLOCKSIZE
+        os.truncate(self.path, -(-end // tarfile.RECORDSIZE) * tarfile.RECORDSIZE)
+
+
+class ZipSink(_ArchiveSink):
+    """Appends READMEs as members of a deflate-compressed zip archive."""
+
+    def _open(self) -> zipfile.ZipFile:
+        archive = zipfile.ZipFile(self.path, mode='a', compression=zipfile.ZIP_DEFLATED)
+        self._start = (archive.start_dir, len(archive.filelist))
+        return archive
+
+    def _add(self, name: str, data: bytes) -> None:
+        self._archive.writestr(name, data)
+
+    def _rollback(self) -> None:
+        if self._archive is None:
+            return
+        archive, self._archive = self._archive, None
+        # Rewrite the central directory over the uncommitted members
+        start_dir, count = self._start
+        del archive.filelist[count:]
+        archive.NameToInfo = {info.filename: info for info in archive.filelist}
+        archive.start_dir = start_dir
+        archive.close()
+
+
+class JsonlSink(OutputSink):
+    """Appends READMEs as ``{"id": ..., "readme": ...}`` lines to a JSONL file."""
+
+    def __init__(self, path: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE):
+        super().__init__(path, buffer_size)
+        self._file: Optional[io.TextIOWrapper] = None
+        self._start = 0
+
+    def _flush(self, records: List[Tuple[str, str]]) -> None:
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+            self._start = self._file.tell()
+        self._file.write("".join(
+            json.dumps({"id": key, "readme": content}, ensure_ascii=False) + "\n"
+            for key, content in records
+        ))
+
+    def _sync(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._start = self._file.tell()
+
+    def _rollback(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            self._file.truncate(self._start)
+
+    def _release(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SqliteSink(OutputSink):
+    """Stores READMEs in a SQLite table keyed by resume ID."""
+
+    def __init__(self, path: Union[str, Path], buffer_size: int = DEFAULT_BUFFER_SIZE):
+        super().__init__(path, buffer_size)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS readmes (id TEXT PRIMARY KEY, readme TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _flush(self, records: List[Tuple[str, str]]) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO readmes (id, readme) VALUES (?, ?)", records
+        )
+
+    def _sync(self) -> None:
+        self._conn.commit()
+
+    def _rollback(self) -> None:
+        self._conn.rollback()
+
+    def _release(self) -> None:
+        self._conn.close()
+
+
+SINKS: Dict[str, Type[OutputSink]] = {
+    "file": FileSink,
+    "tar": TarSink,
+    "zip": ZipSink,
+    "jsonl": JsonlSink,
+    "sqlite": SqliteSink,
+}
+
+
+def open_sink(kind: str, path: Union[str, Path], **kwargs) -> OutputSink:
+    """
+    Create an output sink by name.
+
+    Args:
+        kind (str): One of the keys of ``SINKS``
+        path (Union[str, Path]): Destination file or directory
+        **kwargs: Extra arguments passed to the sink constructor
+
+    Returns:
+        OutputSink: The opened sink
+
+    Raises:
+        ValueError: If the sink kind is unknown
+    """
+    try:
+        sink_cls = SINKS[kind]
+    except KeyError:
+        raise ValueError(
+            f"Invalid sink: {kind}. Available sinks: {', '.join(SINKS)}"
+        ) from None
+    logger.info(f"Opening {kind} sink at {path}")
+    return sink_cls(path, **kwargs)
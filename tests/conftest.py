@@ -0,0 +1,70 @@
+"""
+Shared fixtures for GitProfile Builder tests.
+"""
+
+import copy
+from pathlib import Path
+
+import pytest
+
+from gitprofilebuilder import config
+from gitprofilebuilder.profile_generator import ProfileGenerator
+
+SAMPLE_PROFILE = {
+    "personal_info": {"name": "Jane Doe", "email": "jane@example.com", "location": "Remote"},
+    "summary": "Backend engineer focused on distributed systems.",
+    "work_experience": [
+        {
+            "company": "Example Corp",
+            "title": "Senior Engineer",
+            "duration": "2020 - Present",
+            "responsibilities": ["Built the ingestion pipeline"],
+        }
+    ],
+    "education": [{"degree": "B.Sc. Computer Science", "institution": "State University", "graduation_year": "2016"}],
+    "skills": {"technical_skills": ["Python", "Go"], "soft_skills": ["Mentoring"]},
+    "certifications": [],
+    "enhanced": {},
+}
+
+
+@pytest.fixture
+def api_key(monkeypatch):
+    """Provide a dummy Google API key and a fresh Config singleton."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.setattr(config.Singleton, "_instances", {})
+
+
+@pytest.fixture
+def no_api_key(monkeypatch):
+    """Remove the Google API key so building a ProfileGenerator fails."""
+    monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
+    monkeypatch.setattr(config, "load_dotenv", lambda: None)
+    monkeypatch.setattr(config.Singleton, "_instances", {})
+
+
+@pytest.fixture
+def fake_llm(monkeypatch, api_key):
+    """
+    Replace the LLM pipeline with a stub.
+
+    Resumes whose file name contains ``bad`` fail like an unparseable LLM response.
+    """
+    def generate_profile(self, resume_path):
+        self.resume_text = f"Resume text of {Path(resume_path).name}"
+        if "bad" in Path(resume_path).name:
+            raise ValueError("Failed to parse JSON response")
+        self.structured_data = copy.deepcopy(SAMPLE_PROFILE)
+        return self.structured_data
+
+    monkeypatch.setattr(ProfileGenerator, "generate_profile", generate_profile)
+
+
+@pytest.fixture
+def resumes(tmp_path):
+    """Create empty resume files ``a/cv.pdf``, ``b/cv.pdf`` and ``bad.pdf``."""
+    paths = [tmp_path / "a" / "cv.pdf", tmp_path / "b" / "cv.pdf", tmp_path / "bad.pdf"]
+    for path in paths:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+    return paths
@@ -0,0 +1,134 @@
+"""
+Tests for the command line interface.
+"""
+
+import json
+
+from click.testing import CliRunner
+
+from gitprofilebuilder.cli import cli
+from gitprofilebuilder.sinks import open_sink
+
+from .test_sinks import read_entries
+
+
+def run_batch(resumes, *args, input=None):
+    return CliRunner().invoke(cli, ["batch", *map(str, resumes), *args], input=input)
+
+
+def test_batch_skips_failing_resume(fake_llm, resumes, tmp_path):
+    output = tmp_path / "profiles.jsonl"
+    result = run_batch(resumes, "-s", "jsonl", "-o", str(output))
+
+    assert result.exit_code == 1
+    assert "Failed (1)" in result.output
+    assert "bad.pdf" in result.output
+    with open(output, encoding='utf-8') as f:
+        ids = [json.loads(line)["id"] for line in f]
+    assert ids == ["a/cv", "b/cv"]
+
+
+def test_batch_file_sink_keys_by_relative_path(fake_llm, resumes, tmp_path):
+    output = tmp_path / "profiles"
+    result = run_batch(resumes[:2], "-o", str(output))
+
+    assert result.exit_code == 0, result.output
+    assert sorted(key for key, _ in read_entries("file", output)) == ["a/cv", "b/cv"]
+
+
+def test_batch_rejects_duplicate_keys(fake_llm, tmp_path):
+    resume = tmp_path / "cv.pdf"
+    resume.touch()
+    result = run_batch([resume, resume], "-o", str(tmp_path / "profiles"))
+
+    assert result.exit_code == 1
+    assert "Duplicate resume IDs: cv" in result.output
+    assert not (tmp_path / "profiles").exists()
+
+
+def test_batch_keeps_output_when_generator_fails(no_api_key, resumes, tmp_path):
+    output = tmp_path / "profiles.db"
+    with open_sink("sqlite", output) as sink:
+        sink.write("old", "kept")
+
+    result = run_batch(resumes[:2], "-s", "sqlite", "-o", str(output), "-f")
+
+    assert result.exit_code == 1
+    assert "GOOGLE_API_KEY" in result.output
+    assert read_entries("sqlite", output) == [("old", "kept")]
+
+
+def test_batch_keeps_output_when_every_resume_fails(fake_llm, resumes, tmp_path):
+    output = tmp_path / "profiles.tar"
+    with open_sink("tar", output) as sink:
+        sink.write("old", "kept")
+
+    result = run_batch(resumes[2:], "-s", "tar", "-o", str(output), "-f")
+
+    assert result.exit_code == 1
+    assert read_entries("tar", output) == [("old", "kept")]
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_batch_force_replaces_archive(fake_llm, resumes, tmp_path):
+    output = tmp_path / "profiles.zip"
+    with open_sink("zip", output) as sink:
+        sink.write("old", "replaced")
+
+    result = run_batch(resumes[:2], "-s", "zip", "-o", str(output), "-f")
+
+    assert result.exit_code == 0, result.output
+    assert [key for key, _ in read_entries("zip", output)] == ["a/cv", "b/cv"]
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_batch_prompts_before_overwrite(fake_llm, resumes, tmp_path):
+    output = tmp_path / "profiles.jsonl"
+    output.write_text("existing\n", encoding='utf-8')
+
+    result = run_batch(resumes[:2], "-s", "jsonl", "-o", str(output), input="n\n")
+
+    assert result.exit_code == 0
+    assert "Operation cancelled." in result.output
+    assert output.read_text(encoding='utf-8') == "existing\n"
+
+
+def test_batch_aborts_on_sink_error(fake_llm, resumes, tmp_path, monkeypatch):
+    def fail(self, records):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("gitprofilebuilder.sinks.JsonlSink._flush", fail)
+    output = tmp_path / "profiles.jsonl"
+    result = run_batch(resumes[:2], "-s", "jsonl", "-o", str(output))
+
+    assert result.exit_code == 1
+    assert "disk full" in result.output
+    assert "Successfully" not in result.output
+    assert not output.exists() or output.read_text(encoding='utf-8') == ""
+
+
+MEMORY_REPORT_TITLES = ["Memory by Stage", "Retained Memory per Resume", "Top Allocators"]
+
+
+def test_batch_profile_memory_report(fake_llm, resumes, tmp_path):
+    result = run_batch(resumes[:2], "-o", str(tmp_path / "profiles"), "--profile-memory")
+
+    assert result.exit_code == 0, result.output
+    for title in MEMORY_REPORT_TITLES:
+        assert title in result.output
+    assert "render_template" in result.output
+    assert "a/cv" in result.output
+    assert "Growth across resumes" in result.output
+
+
+def test_generate_profile_memory_report(fake_llm, resumes, tmp_path, monkeypatch):
+    monkeypatch.setattr("gitprofilebuilder.cli.time.sleep", lambda seconds: None)
+    output = tmp_path / "profile_readme.md"
+    result = CliRunner().invoke(
+        cli, ["generate", str(resumes[0]), "-o", str(output), "--profile-memory"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert output.exists()
+    for title in MEMORY_REPORT_TITLES:
+        assert title in result.output
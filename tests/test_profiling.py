@@ -0,0 +1,97 @@
+"""
+Tests for the opt-in memory profiler.
+"""
+
+import tracemalloc
+
+import pytest
+
+from gitprofilebuilder.profiling import MemoryProfiler, format_bytes, profile_item, profile_stage
+
+
+@pytest.fixture(autouse=True)
+def stop_tracing():
+    yield
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("size, expected", [
+    (0, "0 B"),
+    (512, "512 B"),
+    (1536, "1.5 KiB"),
+    (3 * 1024 * 1024, "3.0 MiB"),
+    (5 * 1024 ** 3, "5.0 GiB"),
+    (-2048, "-2.0 KiB"),
+])
+def test_format_bytes(size, expected):
+    assert format_bytes(size) == expected
+
+
+def test_stage_aggregates_calls():
+    kept = []
+    with MemoryProfiler() as profiler:
+        for _ in range(3):
+            with profiler.stage("load"):
+                scratch = bytearray(1_000_000)
+                del scratch
+            with profiler.stage("keep"):
+                kept.append(bytearray(100_000))
+
+    load, keep = profiler.stages["load"], profiler.stages["keep"]
+    assert load['calls'] == keep['calls'] == 3
+    assert load['peak_bytes'] >= 1_000_000
+    assert abs(load['net_bytes']) < 10_000
+    assert keep['net_bytes'] >= 300_000
+
+
+def test_item_flags_growth_above_threshold():
+    kept = []
+    with MemoryProfiler(growth_threshold=100_000) as profiler:
+        for i in range(3):
+            with profiler.item(f"r{i}"):
+                if i == 1:
+                    kept.append(bytearray(500_000))
+
+    assert [item['resume_id'] for item in profiler.items] == ["r0", "r1", "r2"]
+    assert [item['flagged'] for item in profiler.items] == [False, True, False]
+    assert profiler.items[1]['retained_bytes'] >= 500_000
+    assert 500_000 <= profiler.growth() < 600_000
+
+
+def test_growth_without_items():
+    assert MemoryProfiler().growth() == 0
+
+
+def test_top_allocators():
+    kept = []
+    with MemoryProfiler(top_n=3) as profiler:
+        kept.append(bytearray(1_000_000))
+
+    top = profiler.top_allocators()
+    assert len(top) <= 3
+    assert top[0].size_diff >= 1_000_000
+
+
+def test_stop_leaves_external_tracing_running():
+    tracemalloc.start()
+    with MemoryProfiler():
+        pass
+    assert tracemalloc.is_tracing()
+
+
+def test_stop_ends_own_tracing():
+    with MemoryProfiler():
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
+
+
+def test_disabled_profiler_is_noop():
+    with profile_stage(None, "load"), profile_item(None, "r0"):
+        pass
+
+    profiler = MemoryProfiler()
+    with profiler.stage("load"), profiler.item("r0"):
+        pass
+    assert profiler.stages == {}
+    assert profiler.items == []
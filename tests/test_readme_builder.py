@@ -0,0 +1,63 @@
+"""
+Tests for README generation and saving.
+"""
+
+import pytest
+
+from gitprofilebuilder.profile_generator import ProfileGenerator
+from gitprofilebuilder.profiling import MemoryProfiler
+from gitprofilebuilder.readme_builder import generate_and_save_readme
+from gitprofilebuilder.sinks import open_sink
+
+from .test_sinks import read_entries
+
+
+def test_writes_output_file(fake_llm, resumes, tmp_path):
+    output = tmp_path / "profile_readme.md"
+    assert generate_and_save_readme(resumes[0], output) is None
+    assert "Jane Doe" in output.read_text(encoding='utf-8')
+
+
+def test_writes_into_sink(fake_llm, resumes, tmp_path):
+    output = tmp_path / "profiles.sqlite"
+    with open_sink("sqlite", output) as sink:
+        generate_and_save_readme(resumes[0], sink=sink)
+        generate_and_save_readme(resumes[1], sink=sink, resume_id="b/cv")
+
+    entries = read_entries("sqlite", output)
+    assert [key for key, _ in entries] == ["b/cv", "cv"]
+    assert all("Jane Doe" in readme for _, readme in entries)
+
+
+def test_releases_generator_state_after_resume(fake_llm, resumes, tmp_path):
+    generator = ProfileGenerator()
+    data = generate_and_save_readme(resumes[0], tmp_path / "profile.md", generator=generator, verbose=True)
+
+    assert data['resume_text'] == "Resume text of cv.pdf"
+    assert data['structured_data']['personal_info']['name'] == "Jane Doe"
+    assert generator.resume_text is None
+    assert generator.structured_data is None
+
+
+def test_releases_generator_state_after_failure(fake_llm, resumes, tmp_path):
+    generator = ProfileGenerator()
+    with pytest.raises(ValueError, match="Failed to parse JSON"):
+        generate_and_save_readme(resumes[2], tmp_path / "profile.md", generator=generator)
+
+    assert generator.resume_text is None
+    assert generator.structured_data is None
+
+
+def test_profiler_applies_to_single_call(fake_llm, resumes, tmp_path):
+    own, call = MemoryProfiler(), MemoryProfiler()
+    generator = ProfileGenerator(profiler=own)
+
+    with call:
+        generate_and_save_readme(resumes[0], tmp_path / "a.md", generator=generator, profiler=call)
+    assert generator.profiler is own
+    assert [item['resume_id'] for item in call.items] == ["cv"]
+    assert "render_template" in call.stages
+    assert own.items == [] and own.stages == {}
+
+    generate_and_save_readme(resumes[1], tmp_path / "b.md", generator=generator)
+    assert generator.profiler is own
@@ -0,0 +1,198 @@
+"""
+Tests for README output sinks.
+"""
+
+import json
+import sqlite3
+import tarfile
+import zipfile
+
+import pytest
+
+from gitprofilebuilder.sinks import SINKS, FileSink, SinkError, open_sink, resume_keys
+
+ARCHIVE_KINDS = ["tar", "zip", "jsonl"]
+
+
+def sink_path(kind, tmp_path):
+    if kind == "file":
+        return tmp_path / "profiles"
+    return tmp_path / f"profiles.{kind}"
+
+
+def read_entries(kind, path):
+    """Read ``(key, content)`` pairs back from a sink's output."""
+    if kind == "file":
+        return sorted(
+            (str(p.relative_to(path).with_suffix('').as_posix()), p.read_text(encoding='utf-8'))
+            for p in path.rglob("*.md")
+        )
+    if kind == "tar":
+        with tarfile.open(path) as archive:
+            return [
+                (member.name[:-3], archive.extractfile(member).read().decode('utf-8'))
+                for member in archive.getmembers()
+            ]
+    if kind == "zip":
+        with zipfile.ZipFile(path) as archive:
+            return [
+                (info.filename[:-3], archive.read(info).decode('utf-8'))
+                for info in archive.infolist()
+            ]
+    if kind == "jsonl":
+        with open(path, encoding='utf-8') as f:
+            return [(record["id"], record["readme"]) for record in map(json.loads, f)]
+    if kind == "sqlite":
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute("SELECT id, readme FROM readmes ORDER BY id").fetchall()
+        finally:
+            conn.close()
+    raise AssertionError(kind)
+
+
+@pytest.mark.parametrize("kind", list(SINKS))
+def test_round_trip(kind, tmp_path):
+    path = sink_path(kind, tmp_path)
+    with open_sink(kind, path, buffer_size=2) as sink:
+        for i in range(5):
+            sink.write(f"resume-{i}", f"# Profile {i}\n")
+        sink.commit()
+        sink.write("nested/resume-5", "# Profile 5\n")
+
+    assert sorted(read_entries(kind, path)) == [
+        ("nested/resume-5", "# Profile 5\n"),
+        *[(f"resume-{i}", f"# Profile {i}\n") for i in range(5)],
+    ]
+
+
+@pytest.mark.filterwarnings("ignore:Duplicate name:UserWarning")
+@pytest.mark.parametrize("kind", ARCHIVE_KINDS)
+def test_reopen_appends(kind, tmp_path):
+    path = sink_path(kind, tmp_path)
+    with open_sink(kind, path) as sink:
+        sink.write("cv", "first")
+    with open_sink(kind, path) as sink:
+        sink.write("cv", "second")
+
+    assert read_entries(kind, path) == [("cv", "first"), ("cv", "second")]
+
+
+@pytest.mark.parametrize("kind", ["file", "sqlite"])
+def test_reopen_replaces(kind, tmp_path):
+    path = sink_path(kind, tmp_path)
+    with open_sink(kind, path) as sink:
+        sink.write("cv", "first")
+    with open_sink(kind, path) as sink:
+        sink.write("cv", "second")
+
+    assert read_entries(kind, path) == [("cv", "second")]
+
+
+@pytest.mark.filterwarnings("ignore:Duplicate name:UserWarning")
+@pytest.mark.parametrize("kind", list(SINKS))
+def test_duplicate_key_in_batch(kind, tmp_path):
+    path = sink_path(kind, tmp_path)
+    with open_sink(kind, path) as sink:
+        sink.write("cv", "first")
+        with pytest.raises(ValueError, match="Duplicate key 'cv'"):
+            sink.write("cv", "second")
+        sink.commit()
+        sink.write("cv", "third")
+
+
+@pytest.mark.parametrize("kind", ["tar", "zip", "jsonl", "sqlite"])
+def test_error_inside_with_discards_batch(kind, tmp_path):
+    path = sink_path(kind, tmp_path)
+    with open_sink(kind, path) as sink:
+        sink.write("kept", "committed")
+
+    with pytest.raises(RuntimeError):
+        with open_sink(kind, path, buffer_size=1) as sink:
+            sink.write("a", "flushed")
+            sink.write("b", "flushed")
+            raise RuntimeError("boom")
+
+    assert read_entries(kind, path) == [("kept", "committed")]
+
+    # The output is still usable after the rollback
+    with open_sink(kind, path) as sink:
+        sink.write("later", "appended")
+    assert sorted(read_entries(kind, path)) == [("kept", "committed"), ("later", "appended")]
+
+
+def test_error_inside_with_drops_pending_files(tmp_path):
+    path = sink_path("file", tmp_path)
+    with pytest.raises(RuntimeError):
+        with FileSink(path) as sink:
+            sink.write("a", "pending")
+            raise RuntimeError("boom")
+
+    assert read_entries("file", path) == []
+
+
+def test_failed_flush_keeps_records(tmp_path):
+    class FlakySink(FileSink):
+        failures = 1
+
+        def _flush(self, records):
+            if self.failures:
+                self.failures -= 1
+                raise OSError("disk full")
+            super()._flush(records)
+
+    sink = FlakySink(tmp_path / "profiles", buffer_size=3)
+    sink.write("a", "A")
+    sink.write("b", "B")
+    with pytest.raises(SinkError, match="disk full"):
+        sink.write("c", "C")
+    sink.close()
+
+    assert read_entries("file", tmp_path / "profiles") == [("a", "A"), ("b", "B"), ("c", "C")]
+
+
+def test_failed_close_rolls_back(tmp_path, monkeypatch):
+    path = sink_path("jsonl", tmp_path)
+    with open_sink("jsonl", path) as sink:
+        sink.write("kept", "committed")
+
+    monkeypatch.setattr("gitprofilebuilder.sinks.JsonlSink._sync", lambda self: 1 / 0)
+    with pytest.raises(SinkError):
+        with open_sink("jsonl", path) as sink:
+            sink.write("a", "flushed")
+
+    assert read_entries("jsonl", path) == [("kept", "committed")]
+
+
+def test_file_sink_creates_directory(tmp_path):
+    with open_sink("file", tmp_path / "profiles") as sink:
+        sink.write("a", "A")
+        sink.write("b", "B")
+
+    assert read_entries("file", tmp_path / "profiles") == [("a", "A"), ("b", "B")]
+
+
+def test_file_sink_rejects_file_path(tmp_path):
+    path = tmp_path / "profile_readme.md"
+    path.write_text("existing", encoding='utf-8')
+    with pytest.raises(ValueError, match="not a directory"):
+        open_sink("file", path)
+
+
+def test_write_after_close(tmp_path):
+    sink = open_sink("jsonl", tmp_path / "profiles.jsonl")
+    sink.close()
+    with pytest.raises(ValueError, match="closed"):
+        sink.write("cv", "late")
+
+
+def test_open_sink_unknown_kind(tmp_path):
+    with pytest.raises(ValueError, match="Invalid sink: rar"):
+        open_sink("rar", tmp_path / "profiles.rar")
+
+
+def test_resume_keys(tmp_path):
+    assert resume_keys([tmp_path / "cv.pdf"]) == ["cv"]
+    assert resume_keys([tmp_path / "a" / "cv.pdf", tmp_path / "b" / "cv.pdf"]) == ["a/cv", "b/cv"]
+    with pytest.raises(ValueError, match="Duplicate resume IDs: cv"):
+        resume_keys([tmp_path / "cv.pdf", tmp_path / "cv.PDF"])